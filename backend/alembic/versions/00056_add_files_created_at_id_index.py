@@ -0,0 +1,31 @@
+"""add (created_at, id) index on files for keyset pagination
+
+Revision ID: ab3047a1aad9
+Revises: d1e2f3a4b5c6
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "ab3047a1aad9"
+down_revision: Union[str, None] = "d1e2f3a4b5c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_files_created_at_id",
+        "files",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("is_deleted = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_files_created_at_id", table_name="files")
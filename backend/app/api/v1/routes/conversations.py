@@ -468,11 +468,10 @@ async def update_no_agent(
 
     # broadcast statistics
     _ = asyncio.create_task(
-        socket_connection_manager.broadcast(
+        socket_connection_manager.broadcast_raw(
             msg_type="statistics",
-            payload=upd_conv_pyd.model_dump(),
+            payload_json=upd_conv_pyd.model_dump_json(),
             room_id=conversation_id,
-            current_user_id=get_current_user_id(),
             required_topic="statistics",
             tenant_id=tenant_id,
         )
@@ -180,16 +180,32 @@ async def list_files(
     storage_provider: Optional[str] = None,
     limit: Optional[int] = None,
     offset: Optional[int] = None,
+    cursor: Optional[UUID] = None,
     service: FileManagerService = Injected(FileManagerService),
 ):
-    """List files with optional filtering."""
+    """List files with optional filtering.
+
+    Without ``offset`` files are paged with keyset pagination: pass ``cursor``
+    (the id of the last file of the previous page) to get the next page. An
+    unknown ``cursor`` returns 404; ``cursor`` and ``offset`` cannot be combined.
+    """
+    if cursor is not None and offset is not None:
+        raise AppException(ErrorKey.INVALID_PAGINATION_PARAMETERS, 400)
     try:
+        if offset is None:
+            return await service.list_files_after(
+                cursor_id=cursor,
+                limit=limit,
+                storage_provider=storage_provider,
+            )
         files = await service.list_files(
             storage_provider=storage_provider,
             limit=limit,
             offset=offset
         )
         return files
+    except AppException:
+        raise
     except Exception as e:
         raise AppException(ErrorKey.INTERNAL_ERROR,500,f"Failed to list files: {str(e)}")
 
@@ -139,6 +139,7 @@ class ErrorKey(Enum):
     LANGUAGE_ALREADY_EXISTS = "LANGUAGE_ALREADY_EXISTS"
     INTERNAL_SERVER_ERROR = "INTERNAL_SERVER_ERROR"
     EMPTY_MESSAGES_FOR_CONVERSATION = "EMPTY_MESSAGES"
+    INVALID_PAGINATION_PARAMETERS = "INVALID_PAGINATION_PARAMETERS"
 
 
 ERROR_MESSAGES = {
@@ -270,6 +271,7 @@ ERROR_MESSAGES = {
         ErrorKey.LANGUAGE_ALREADY_EXISTS: "A language with this code already exists.",
         ErrorKey.INTERNAL_SERVER_ERROR: "An internal server error occurred. Please try again later.",
         ErrorKey.EMPTY_MESSAGES_FOR_CONVERSATION: "No messages were found for this conversation.",
+        ErrorKey.INVALID_PAGINATION_PARAMETERS: "Use either cursor or offset for pagination, not both.",
     },
     "fr": {
         ErrorKey.INTERNAL_ERROR: "Une erreur interne du serveur est survenue. Veuillez réessayer plus tard.",
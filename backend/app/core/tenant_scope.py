@@ -5,7 +5,7 @@ Custom tenant-aware scope for dependency injection
 from injector import ScopeDecorator
 import logging
 import threading
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from typing import Any, Dict, Type, TypeVar
 
 from injector import Provider, Scope, InstanceProvider
@@ -59,10 +59,16 @@ class TenantScope(Scope):
 tenant_scope = ScopeDecorator(TenantScope)
 
 
-def set_tenant_context(tenant_id: str) -> None:
-    """Set the tenant ID in the current context"""
-    _tenant_id_ctx.set(tenant_id)
+def set_tenant_context(tenant_id: str) -> Token[str]:
+    """Set the tenant ID in the current context and return the reset token"""
+    token = _tenant_id_ctx.set(tenant_id)
     logger.debug(f"Set tenant context: {tenant_id}")
+    return token
+
+
+def reset_tenant_context(token: Token[str]) -> None:
+    """Restore the tenant context that was active before set_tenant_context"""
+    _tenant_id_ctx.reset(token)
 
 
 def get_tenant_context() -> str:
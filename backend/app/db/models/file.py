@@ -1,5 +1,5 @@
 from typing import Optional
-from sqlalchemy import String, Index, Text, BigInteger
+from sqlalchemy import String, Index, Text, BigInteger, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from enum import Enum
@@ -25,6 +25,13 @@ class FileModel(Base):
         Index("idx_files_path", "path"),
         Index("idx_files_storage_provider", "storage_provider"),
         Index("idx_files_storage_path", "storage_path"),
+        # Keyset pagination of live files, newest first
+        Index(
+            "idx_files_created_at_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("is_deleted = 0"),
+        ),
     )
 
     name: Mapped[str] = mapped_column(String(500), nullable=False)
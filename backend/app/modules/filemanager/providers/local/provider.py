@@ -9,6 +9,8 @@ import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+import aiofiles
+
 from ..base import BaseStorageProvider
 from app.core.project_path import DATA_VOLUME
 
@@ -41,9 +43,14 @@ class LocalFileSystemProvider(BaseStorageProvider):
         """
         Initialize the provider by ensuring base directory exists.
 
+        Repeated calls on an already initialized provider are no-ops.
+
         Returns:
             True if initialization successful, False otherwise
         """
+        if self._initialized:
+            return True
+
         try:
             self.base_path.mkdir(parents=True, exist_ok=True)
             self._initialized = True
@@ -98,8 +105,9 @@ class LocalFileSystemProvider(BaseStorageProvider):
             # Create parent directories if they don't exist
             full_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file content
-            full_path.write_bytes(file_content)
+            # Write file content without blocking the event loop
+            async with aiofiles.open(full_path, "wb") as f:
+                await f.write(file_content)
 
             logger.debug(f"Uploaded file to {full_path}")
             return True
@@ -120,10 +128,11 @@ class LocalFileSystemProvider(BaseStorageProvider):
         try:
             full_path = self._resolve_path(file_path)
 
-            if not full_path.exists():
-                raise FileNotFoundError(f"File not found: {file_path}")
-
-            return full_path.read_bytes()
+            try:
+                async with aiofiles.open(full_path, "rb") as f:
+                    return await f.read()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {file_path}") from None
         except Exception as e:
             logger.error(f"Failed to download file {file_path}: {e}")
             raise
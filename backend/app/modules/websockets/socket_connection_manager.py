@@ -198,6 +198,54 @@ class SocketConnectionManager:
         if msg_type == "takeover":
             payload["takeover_user_id"] = str(current_user_id)
 
+        await self._publish(
+            room_id=room_id,
+            msg_type=msg_type,
+            payload=payload,
+            required_topic=required_topic,
+            tenant_id=tenant_id,
+        )
+
+    async def broadcast_raw(
+        self,
+        room_id: Hashable,
+        msg_type: str,
+        payload_json: str,
+        required_topic: str | None = None,
+        tenant_id: str | None = None,
+    ) -> None:
+        """
+        Broadcast a payload that is already serialized to JSON.
+
+        The payload is embedded into the outgoing frame as-is, so callers holding
+        a large pydantic model can serialize it once (e.g. ``model_dump_json()``)
+        instead of dumping to a dict that is re-encoded on every hop.
+        """
+        if not settings.USE_WS:
+            return
+        await self._publish(
+            room_id=room_id,
+            msg_type=msg_type,
+            payload_json=payload_json,
+            required_topic=required_topic,
+            tenant_id=tenant_id,
+        )
+
+    async def _publish(
+        self,
+        room_id: Hashable,
+        msg_type: str,
+        payload: dict | None = None,
+        payload_json: str | None = None,
+        required_topic: str | None = None,
+        tenant_id: str | None = None,
+    ) -> None:
+        """
+        Publish a message to Redis Pub/Sub for delivery across all server instances,
+        falling back to local connections when Redis is unavailable.
+
+        Exactly one of ``payload`` and ``payload_json`` (already serialized) is used.
+        """
         tenant_aware_room_id = self._get_tenant_aware_room_id(room_id, tenant_id)
 
         # Publish to Redis for multi-server broadcasting (if available)
@@ -206,12 +254,20 @@ class SocketConnectionManager:
                 redis_channel = self._get_redis_channel(tenant_aware_room_id)
                 message_data = {
                     "type": msg_type,
-                    "payload": payload,
                     "required_topic": required_topic,
                     "room_id": str(room_id),
                     "tenant_id": tenant_id,
                 }
-                await self._redis_client.publish(redis_channel, json.dumps(message_data, default=str))
+                if payload_json is not None:
+                    message_data["payload_raw"] = payload_json
+                    # Also inline the payload for instances on the previous release,
+                    # which only read "payload"; drop once all instances read payload_raw
+                    envelope = json.dumps(message_data, default=str)
+                    envelope = f'{envelope[:-1]}, "payload": {payload_json}}}'
+                else:
+                    message_data["payload"] = payload
+                    envelope = json.dumps(message_data, default=str)
+                await self._redis_client.publish(redis_channel, envelope)
                 logger.info(
                     f"[BROADCAST] Published to Redis channel: {redis_channel} | "
                     f"Room: {tenant_aware_room_id} | Type: {msg_type} | Topic: {required_topic}"
@@ -229,22 +285,29 @@ class SocketConnectionManager:
             required_topic=required_topic,
             room_id=room_id,
             tenant_id=tenant_id,
+            payload_json=payload_json,
         )
 
     async def _broadcast_local(
         self,
         tenant_aware_room_id: Hashable,
         msg_type: str,
-        payload: dict,
+        payload: dict | None,
         required_topic: str | None = None,
         room_id: Hashable | None = None,
         tenant_id: str | None = None,
+        payload_json: str | None = None,
     ) -> None:
         """
         Broadcast a message to local WebSocket connections only.
         Used for single-server mode or as fallback when Redis is unavailable.
+
+        If ``payload_json`` is given it is used verbatim instead of encoding ``payload``.
         """
-        message = json.dumps({"type": msg_type, "payload": payload}, default=str)
+        if payload_json is not None:
+            message = f'{{"type": {json.dumps(msg_type)}, "payload": {payload_json}}}'
+        else:
+            message = json.dumps({"type": msg_type, "payload": payload}, default=str)
         targets = list(self._rooms.get(tenant_aware_room_id, []))
 
         logger.info(
@@ -369,6 +432,7 @@ class SocketConnectionManager:
 
             msg_type = data.get("type")
             payload = data.get("payload", {})
+            payload_json = data.get("payload_raw")
             required_topic = data.get("required_topic")
             room_id = data.get("room_id")
             tenant_id = data.get("tenant_id")
@@ -389,6 +453,7 @@ class SocketConnectionManager:
                 required_topic=required_topic,
                 room_id=room_id,
                 tenant_id=tenant_id,
+                payload_json=payload_json,
             )
 
         except Exception as exc:
@@ -1,4 +1,5 @@
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Callable, Final, List, Dict, Any, Optional, Tuple
 import logging
 import json
 import re
@@ -7,6 +8,35 @@ from app.modules.workflow.agents.base_tool import BaseTool
 
 logger = logging.getLogger(__name__)
 
+# Doubled braces, as produced by models that echo format-string escaped templates
+_DOUBLE_BRACES_PATTERN: Final[re.Pattern[str]] = re.compile(r"\{\{|\}\}")
+
+# Tokens that matter for locating a JSON object, one capture group per kind:
+# 1) a complete string literal (so braces inside it are skipped), 2) a doubled
+# opening brace "{{", 3) an opening brace, 4) a closing brace
+_JSON_TOKEN_PATTERN: Final[re.Pattern[str]] = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*"?)|(\{\s*\{)|(\{)|(\})', re.DOTALL)
+
+# Nesting depth change per token kind, indexed by the matched group number
+_JSON_TOKEN_DEPTH_DELTA: Final[Tuple[int, ...]] = (0, 0, 2, 1, -1)
+_DOUBLED_BRACE_TOKEN: Final[int] = 2
+
+# Keys and action names looked up on every parsed agent response
+_ACTION_KEY: Final[str] = "action"
+_RESPONSE_KEY: Final[str] = "response"
+_DIRECT_RESPONSE_ACTION: Final[str] = "direct_response"
+
+# Decoder used to read the first JSON object out of a longer response
+_JSON_DECODER: Final[json.JSONDecoder] = json.JSONDecoder()
+
+# Responses longer than this are not memoized by the doubled-brace scan
+_JSON_CACHE_MAX_RESPONSE_LENGTH: Final[int] = 8192
+
+# ReAct response sections
+_FINAL_ANSWER_PATTERN: Final[re.Pattern[str]] = re.compile(r'Final Answer:\s*(.+)', re.DOTALL)
+_THOUGHT_PATTERN: Final[re.Pattern[str]] = re.compile(r'Thought:\s*(.+?)(?=Action:|$)', re.DOTALL)
+_ACTION_PATTERN: Final[re.Pattern[str]] = re.compile(r'Action:\s*(.+)')
+_ACTION_INPUT_PATTERN: Final[re.Pattern[str]] = re.compile(r'Action Input:\s*(.+)', re.DOTALL)
+
 
 # ==================== PARAMETER VALIDATION UTILITIES ====================
 
@@ -269,25 +299,102 @@ def remove_tool_from_agent(tools: List[BaseTool], tool_map: Dict[str, BaseTool],
 
 # ==================== JSON PARSING UTILITIES ====================
 
+def _find_json_span(text: str, start: int) -> Optional[Tuple[int, int, bool]]:
+    """Find the balanced JSON object starting at text[start], ignoring braces inside strings.
+
+    Returns the (start, end) slice bounds of the object plus a flag telling
+    whether it contains doubled braces (a '{' directly following another '{',
+    which valid JSON never has), or None if there is no balanced object.
+
+    The regex engine skips over everything between structural tokens, so only
+    braces and whole string literals are visited in Python.
+    """
+    depth: int = 0
+    doubled_braces: bool = False
+    for match in _JSON_TOKEN_PATTERN.finditer(text, start):
+        kind: int = match.lastindex or 0
+        if kind == _DOUBLED_BRACE_TOKEN:
+            doubled_braces = True
+        depth += _JSON_TOKEN_DEPTH_DELTA[kind]
+        if depth == 0:
+            return start, match.end(), doubled_braces
+    return None
+
+
+def _collapse_double_braces(text: str) -> str:
+    """Turn every {{ / }} into a single brace"""
+    return _DOUBLE_BRACES_PATTERN.sub(lambda m: m.group()[0], text)
+
+
+def _find_doubled_brace_json_text(text: str, start: int) -> Optional[str]:
+    """Locate a JSON object written with doubled braces at text[start] and collapse them
+
+    Handles nested doubled braces, e.g. {{ "parameters": {{ "query": "x" }} }},
+    and returns None when the object at start has none.
+    """
+    span = _find_json_span(text, start)
+    if span is None or not span[2]:
+        return None
+    return _collapse_double_braces(text[span[0]:span[1]])
+
+
+# Weak models repeat the same doubled-brace responses; memoize the token scan
+# (text in, text out) so every caller still decodes its own, independently
+# mutable dict.
+_find_doubled_brace_json_text_cached = lru_cache(maxsize=512)(_find_doubled_brace_json_text)
+
+
 def parse_json_response(response: str) -> Optional[Dict[str, Any]]:
     """Parse JSON formatted response, handling double curly braces from weak models"""
+    response_clean = response.strip()
+
+    # Handle double curly braces {{ }} that weak models sometimes return
+    if response_clean.startswith('{{') and response_clean.endswith('}}'):
+        # Strip the outer curly braces
+        response_clean = response_clean[1:-1].strip()
+
+    start = response_clean.find('{')
+    if start == -1:
+        return None
+
+    # The C decoder finds the end of the first object itself and ignores
+    # whatever text follows it
     try:
-        response_clean = response.strip()
-        
-        # Handle double curly braces {{ }} that weak models sometimes return
-        if response_clean.startswith('{{') and response_clean.endswith('}}'):
-            # Strip the outer curly braces
-            response_clean = response_clean[1:-1].strip()
-        
-        json_start = response_clean.find('{')
-        json_end = response_clean.rfind('}') + 1
-        
-        if json_start != -1 and json_end > json_start:
-            json_str = response_clean[json_start:json_end]
-            return json.loads(json_str)
+        return _JSON_DECODER.raw_decode(response_clean, start)[0]
     except json.JSONDecodeError:
         pass
-    return None
+
+    # Only nested doubled braces need the slower token scan
+    if len(response_clean) > _JSON_CACHE_MAX_RESPONSE_LENGTH:
+        json_text = _find_doubled_brace_json_text(response_clean, start)
+    else:
+        json_text = _find_doubled_brace_json_text_cached(response_clean, start)
+    if json_text is None:
+        return None
+    try:
+        return json.loads(json_text)
+    except json.JSONDecodeError:
+        return None
+
+
+def parse_json_responses(responses: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """Parse a batch of JSON formatted responses, see parse_json_response"""
+    return [parse_json_response(response) for response in responses]
+
+
+def _direct_response_text(parsed_response: Dict[str, Any]) -> str:
+    """Extract the response field - always return it even if empty"""
+    response_text = parsed_response.get(_RESPONSE_KEY)
+    if response_text is not None:
+        return str(response_text)
+    # If response field is missing, return empty string
+    return ""
+
+
+# Actions whose JSON carries a reply for the user, mapped to the function extracting it
+_RESPONSE_TEXT_EXTRACTORS: Final[Dict[str, Callable[[Dict[str, Any]], str]]] = {
+    _DIRECT_RESPONSE_ACTION: _direct_response_text,
+}
 
 
 def extract_direct_response(response: str) -> Optional[str]:
@@ -298,38 +405,21 @@ def extract_direct_response(response: str) -> Optional[str]:
         - None if the response is JSON but not a direct_response (caller should use original)
         - The original response if it's not JSON format (plain text)
     """
+    if '{' not in response:
+        # Plain text response, return as-is
+        return response
+
     parsed_response = parse_json_response(response)
-    if parsed_response and parsed_response.get("action") == "direct_response":
-        # Extract the response field - always return it even if empty
-        response_text = parsed_response.get("response")
-        if response_text is not None:
-            return str(response_text)
-        # If response field is missing, return empty string
-        return ""
-    
-    # If response looks like JSON but wasn't parsed, try harder to parse it
-    response_stripped = response.strip()
-    if response_stripped.startswith('{') and 'direct_response' in response_stripped:
-        # Try to parse more aggressively
-        try:
-            # Handle double curly braces {{ }} that weak models sometimes return
-            if response_stripped.startswith('{{') and response_stripped.endswith('}}'):
-                response_stripped = response_stripped[1:-1].strip()
-            
-            # Try parsing the entire string
-            parsed = json.loads(response_stripped)
-            if parsed.get("action") == "direct_response":
-                response_text = parsed.get("response")
-                if response_text is not None:
-                    return str(response_text)
-        except json.JSONDecodeError:
-            pass
+    if parsed_response:
+        action = parsed_response.get(_ACTION_KEY)
+        extractor = _RESPONSE_TEXT_EXTRACTORS.get(action) if isinstance(action, str) else None
+        if extractor is not None:
+            return extractor(parsed_response)
     
     # Check if response looks like JSON (starts with {)
     # If it's JSON but not direct_response, return None so caller uses original
     # If it's not JSON (plain text), return the original response
-    if response_stripped.startswith('{'):
-        # Looks like JSON but not a direct_response, return None
+    if response.lstrip().startswith('{'):
         return None
     
     # Plain text response, return as-is
@@ -340,7 +430,7 @@ def extract_direct_response(response: str) -> Optional[str]:
 
 def extract_final_answer(text: str) -> Optional[str]:
     """Extract final answer from ReAct response"""
-    final_match = re.search(r'Final Answer:\s*(.+)', text, re.DOTALL)
+    final_match = _FINAL_ANSWER_PATTERN.search(text)
     if not final_match:
         return None
     
@@ -359,14 +449,14 @@ def extract_final_answer(text: str) -> Optional[str]:
 
 def extract_thought(text: str) -> str:
     """Extract thought from ReAct response"""
-    thought_match = re.search(r'Thought:\s*(.+?)(?=Action:|$)', text, re.DOTALL)
+    thought_match = _THOUGHT_PATTERN.search(text)
     return thought_match.group(1).strip() if thought_match else ""
 
 
 def parse_react_action(text: str) -> Dict[str, Any]:
     """Parse action from ReAct response format"""
-    action_match = re.search(r'Action:\s*(.+)', text)
-    action_input_match = re.search(r'Action Input:\s*(.+)', text, re.DOTALL)
+    action_match = _ACTION_PATTERN.search(text)
+    action_input_match = _ACTION_INPUT_PATTERN.search(text)
     
     action = action_match.group(1).strip() if action_match else "none"
     action_input = {}
@@ -1,7 +1,7 @@
 from uuid import UUID
 from injector import inject
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, and_, or_, tuple_
 from typing import List, Optional
 from app.core.exceptions.error_messages import ErrorKey
 from app.core.exceptions.exception_classes import AppException
@@ -81,14 +81,8 @@ class FileManagerRepository:
         offset: Optional[int] = None
     ) -> List[FileModel]:
         """List files with optional filtering."""
-        query = select(FileModel).where(FileModel.is_deleted == 0)
-
-        if user_id:
-            query = query.where(FileModel.created_by == user_id)
-        if storage_provider:
-            query = query.where(FileModel.storage_provider == storage_provider)
-
-        query = query.order_by(FileModel.created_at.desc())
+        query = self._list_files_query(user_id, storage_provider)
+        query = query.order_by(FileModel.created_at.desc(), FileModel.id.desc())
 
         if limit:
             query = query.limit(limit)
@@ -98,6 +92,54 @@ class FileManagerRepository:
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def list_files_after(
+        self,
+        cursor_id: Optional[UUID] = None,
+        limit: Optional[int] = None,
+        user_id: Optional[UUID] = None,
+        storage_provider: Optional[str] = None,
+    ) -> List[FileModel]:
+        """
+        List files newest first using keyset pagination.
+
+        Files are ordered by ``(created_at, id)`` like ``list_files``; the page
+        after ``cursor_id`` is fetched with a range seek on that pair over
+        ``idx_files_created_at_id`` instead of an OFFSET scan.
+
+        Raises:
+            AppException: If ``cursor_id`` is not a file visible with the same filters.
+        """
+        query = self._list_files_query(user_id, storage_provider)
+        if cursor_id:
+            cursor_query = query.with_only_columns(FileModel.created_at).where(FileModel.id == cursor_id)
+            cursor_created_at = (await self.db.execute(cursor_query)).scalar_one_or_none()
+            if cursor_created_at is None:
+                raise AppException(
+                    error_key=ErrorKey.FILE_NOT_FOUND,
+                    status_code=404,
+                    error_detail=f"Pagination cursor {cursor_id} not found",
+                )
+            query = query.where(
+                tuple_(FileModel.created_at, FileModel.id) < (cursor_created_at, cursor_id)
+            )
+
+        query = query.order_by(FileModel.created_at.desc(), FileModel.id.desc())
+        if limit:
+            query = query.limit(limit)
+
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    def _list_files_query(self, user_id: Optional[UUID], storage_provider: Optional[str]):
+        query = select(FileModel).where(FileModel.is_deleted == 0)
+
+        if user_id:
+            query = query.where(FileModel.created_by == user_id)
+        if storage_provider:
+            query = query.where(FileModel.storage_provider == storage_provider)
+
+        return query
+
     async def update_file(self, file_id: UUID, update_data: FileBase) -> FileModel:
         """Update file metadata."""
         file = await self.get_file_by_id(file_id)
@@ -293,6 +293,21 @@ class FileManagerService:
             offset=offset
         )
 
+    async def list_files_after(
+        self,
+        cursor_id: Optional[UUID] = None,
+        limit: Optional[int] = None,
+        user_id: Optional[UUID] = None,
+        storage_provider: Optional[str] = None,
+    ) -> list[FileModel]:
+        """List files newest first, starting after the given cursor file id."""
+        return await self.repository.list_files_after(
+            cursor_id=cursor_id,
+            limit=limit,
+            user_id=user_id,
+            storage_provider=storage_provider,
+        )
+
     async def update_file(self, file_id: UUID, file: UploadFile, file_base: FileBase) -> FileModel:
         """Update file metadata."""
         # update the file
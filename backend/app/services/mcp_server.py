@@ -1,9 +1,12 @@
 import logging
 from typing import List, Optional, Dict, Any
 from uuid import UUID
+from fastapi_cache.coder import PickleCoder
+from fastapi_cache.decorator import cache
 from injector import inject
 from fastapi import Request
 
+from app.cache.redis_cache import invalidate_cache, make_key_builder
 from app.core.exceptions.error_messages import ErrorKey
 from app.core.exceptions.exception_classes import AppException
 from app.core.utils.encryption_utils import encrypt_key
@@ -19,6 +22,8 @@ from app.schemas.mcp_server import (
 
 logger = logging.getLogger(__name__)
 
+mcp_server_api_key_hash_key_builder = make_key_builder("api_key_hash")
+
 
 def _extract_input_schema_from_chat_input_node(workflow_model) -> Dict[str, Any]:
     """
@@ -174,6 +179,8 @@ class MCPServerService:
             is_active=data.is_active,
             workflows=workflows_data,
         )
+        # Drop any cached miss for this key so it validates immediately
+        await invalidate_cache("mcp_server:api_key_hash", api_key_hash)
 
         base_url = str(request.base_url).rstrip("/") if request else None
         return await self._to_response(mcp_server, base_url=base_url)
@@ -300,6 +307,11 @@ class MCPServerService:
                 error_key=ErrorKey.WEBHOOK_NOT_FOUND,
                 error_detail="MCP server not found",
             )
+        # The old key may have been rotated or the server deactivated; the new
+        # key may have a cached miss
+        await invalidate_cache("mcp_server:api_key_hash", existing.api_key_hash)
+        if api_key_hash:
+            await invalidate_cache("mcp_server:api_key_hash", api_key_hash)
 
         base_url = str(request.base_url).rstrip("/") if request else None
         return await self._to_response(updated, base_url=base_url)
@@ -310,11 +322,29 @@ class MCPServerService:
         if not user_id:
             raise AppException(status_code=401, error_key=ErrorKey.NOT_AUTHENTICATED)
 
-        return await self.repo.delete(mcp_server_id, user_id)
+        existing = await self.repo.get_by_id(mcp_server_id, user_id)
+        deleted = await self.repo.delete(mcp_server_id, user_id)
+        if deleted and existing:
+            await invalidate_cache("mcp_server:api_key_hash", existing.api_key_hash)
+        return deleted
 
     async def validate_api_key(self, api_key: str) -> Optional[MCPServerResponse]:
         """Validate API key and return MCP server if valid."""
-        api_key_hash = hash_api_key(api_key)
+        return await self._validate_api_key_hash(hash_api_key(api_key))
+
+    @cache(
+        expire=60,
+        namespace="mcp_server:api_key_hash",
+        key_builder=mcp_server_api_key_hash_key_builder,
+        coder=PickleCoder,
+    )
+    async def _validate_api_key_hash(self, api_key_hash: str) -> Optional[MCPServerResponse]:
+        """Look up the active MCP server for an API key hash.
+
+        Results, including misses, are cached briefly so invalid-key storms
+        don't hit the database on every request. The cache is keyed on the
+        hash so plaintext keys never reach Redis.
+        """
         mcp_server = await self.repo.get_by_api_key_hash(api_key_hash)
 
         if not mcp_server:
@@ -191,13 +191,12 @@ async def process_conversation_update_with_agent(
 
     upd_conv_pyd: ConversationRead = ConversationRead.model_validate(updated_conversation)
 
-    # 1:1 chat: broadcast statistics
+    # 1:1 chat: broadcast statistics (serialized once, forwarded as-is to every subscriber)
     _ = asyncio.create_task(
-        socket_connection_manager.broadcast(
+        socket_connection_manager.broadcast_raw(
             msg_type="statistics",
-            payload=upd_conv_pyd.model_dump(),
+            payload_json=upd_conv_pyd.model_dump_json(),
             room_id=conversation_id,
-            current_user_id=current_user_id,
             required_topic="statistics",
             tenant_id=tenant_id,
         )
@@ -20,6 +20,8 @@ import os
 import argparse
 from typing import Dict, Any
 
+from cachetools import TTLCache
+
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -38,9 +40,17 @@ from app.db.models.mcp_server import MCPServerModel
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Short-lived lookup cache keyed by api_key_hash. Misses are stored as None so
+# repeated unknown keys don't trigger the DB queries again until the entry expires.
+_mcp_server_by_api_key_hash: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
 
 async def get_mcp_server_by_api_key(api_key: str):
     """Get MCP server by API key."""
+    api_key_hash = hash_api_key(api_key)
+    if api_key_hash in _mcp_server_by_api_key_hash:
+        return _mcp_server_by_api_key_hash[api_key_hash]
+
     # Initialize multi-tenant manager if needed
     await multi_tenant_manager.initialize()
     
@@ -50,11 +60,11 @@ async def get_mcp_server_by_api_key(api_key: str):
     async with session_factory() as session:
         try:
             # Get MCP server by API key hash
-            api_key_hash = hash_api_key(api_key)
             repo = MCPServerRepository(session)
             mcp_server_model = await repo.get_by_api_key_hash(api_key_hash)
             
             if not mcp_server_model or mcp_server_model.is_active != 1:
+                _mcp_server_by_api_key_hash[api_key_hash] = None
                 return None
             
             # Load workflows with relationships
@@ -66,6 +76,7 @@ async def get_mcp_server_by_api_key(api_key: str):
             mcp_server_model = result.scalar_one_or_none()
             
             if not mcp_server_model:
+                _mcp_server_by_api_key_hash[api_key_hash] = None
                 return None
             
             # Convert to response format manually
@@ -98,7 +109,9 @@ async def get_mcp_server_by_api_key(api_key: str):
                     self.workflows = workflows_list
                     self.is_active = model.is_active
             
-            return MCPServerResponseObj(mcp_server_model, workflows)
+            mcp_server = MCPServerResponseObj(mcp_server_model, workflows)
+            _mcp_server_by_api_key_hash[api_key_hash] = mcp_server
+            return mcp_server
         except Exception as e:
             logger.error(f"Error getting MCP server: {e}", exc_info=True)
             return None
@@ -0,0 +1,96 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.core.exceptions.exception_classes import AppException
+from app.db.models.audit_log import AuditLogModel
+from app.db.models.file import FileModel
+from app.repositories.file_manager import FileManagerRepository
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(type_, compiler, **kw):
+    """Let the files table be created on the in-memory SQLite test database."""
+    return "JSON"
+
+
+@pytest_asyncio.fixture
+async def db_session():
+    """Create an in-memory database holding the files table and the audit log its flushes write to."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(AuditLogModel.__table__.create)
+        await conn.run_sync(FileModel.__table__.create)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def seeded_files(db_session):
+    """Seed files whose id order deliberately disagrees with their created_at order."""
+    base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    files = []
+    for index in range(5):
+        files.append(FileModel(
+            # Ids descend while created_at ascends, like seeded or imported rows.
+            # The hex letters keep SQLite from storing the id with numeric affinity.
+            id=UUID(f"ffffffff-0000-4000-8000-{100 - index:012x}"),
+            name=f"file_{index}.txt",
+            path=f"file_{index}.txt",
+            storage_path=f"file_{index}.txt",
+            storage_provider="local",
+            created_at=base_time + timedelta(minutes=index // 2),
+        ))
+    db_session.add_all(files)
+    await db_session.commit()
+    return files
+
+
+class TestListFilesAfter:
+    """Test keyset pagination of file listings."""
+
+    @pytest.mark.asyncio
+    async def test_pages_match_list_files_order(self, db_session, seeded_files):
+        """Walking cursor pages yields exactly the list_files order, without gaps or repeats."""
+        repository = FileManagerRepository(db=db_session)
+        expected = [file.id for file in await repository.list_files()]
+
+        paged = []
+        cursor_id = None
+        while True:
+            page = await repository.list_files_after(cursor_id=cursor_id, limit=2)
+            if not page:
+                break
+            paged.extend(file.id for file in page)
+            cursor_id = page[-1].id
+
+        assert paged == expected
+        assert len(paged) == len(seeded_files)
+
+    @pytest.mark.asyncio
+    async def test_first_page_without_cursor(self, db_session, seeded_files):
+        """Without a cursor the newest files come first, ties broken by id."""
+        repository = FileManagerRepository(db=db_session)
+
+        page = await repository.list_files_after(limit=3)
+
+        assert [file.name for file in page] == ["file_4.txt", "file_2.txt", "file_3.txt"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_cursor_raises(self, db_session, seeded_files):
+        """A cursor that matches no listed file is rejected instead of returning an empty page."""
+        repository = FileManagerRepository(db=db_session)
+
+        with pytest.raises(AppException) as exc_info:
+            await repository.list_files_after(cursor_id=UUID(int=1), storage_provider="local")
+
+        assert exc_info.value.status_code == 404
+
+        with pytest.raises(AppException):
+            await repository.list_files_after(cursor_id=seeded_files[0].id, storage_provider="s3")
@@ -1,19 +1,17 @@
 import pytest
-import tempfile
-import shutil
+import pytest_asyncio
 import logging
 import io
+from types import SimpleNamespace
 from uuid import uuid4
-from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi import UploadFile
 
 from app.services.file_manager import FileManagerService
-from app.repositories.file_manager import FileManagerRepository
 from app.schemas.file import FileBase
 from app.modules.filemanager.providers.local.provider import LocalFileSystemProvider
-from app.db.models.file import FileModel
-from app.core.tenant_scope import set_tenant_context, clear_tenant_context
+from app.core.tenant_scope import set_tenant_context, reset_tenant_context
 
 logger = logging.getLogger(__name__)
 
@@ -28,41 +26,70 @@ def create_mock_upload_file(filename: str = "test.txt", content: bytes = b"test
     return mock_file
 
 
+class _FakeFileManagerRepository:
+    """Stand-in for FileManagerRepository exposing only the methods the service uses here."""
+
+    def __init__(self):
+        self.create_file = AsyncMock()
+        self.get_file_by_id = AsyncMock()
+        self.delete_file = AsyncMock()
+
+
 # ==================== Fixtures ====================
 
+@pytest.fixture(scope="session")
+def _storage_root(tmp_path_factory):
+    """Create one base directory for file storage, cleaned up by pytest."""
+    return tmp_path_factory.mktemp("file_mgr_storage")
+
+
 @pytest.fixture
-def temp_storage_dir():
-    """Create a temporary directory for file storage."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir, ignore_errors=True)
+def temp_storage_dir(_storage_root):
+    """Create an isolated per-test directory for file storage."""
+    storage_dir = _storage_root / uuid4().hex
+    storage_dir.mkdir()
+    return str(storage_dir)
 
 
 @pytest.fixture
 def local_provider(temp_storage_dir):
-    """Create a real local file system storage provider."""
+    """Create a real local file system storage provider over the per-test directory."""
     return LocalFileSystemProvider(config={"base_path": temp_storage_dir})
 
 
 @pytest.fixture
 def mock_repository():
     """Create a mocked file manager repository."""
-    return AsyncMock(spec=FileManagerRepository)
+    return _FakeFileManagerRepository()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(loop_scope="module")
+async def service(mock_repository, local_provider):
+    """Create a file manager service bound to the local provider."""
+    service = FileManagerService(repository=mock_repository)
+    await service.set_storage_provider(local_provider)
+    return service
+
+
+@pytest.fixture(scope="session")
 def test_user_id():
-    """Generate a test user ID."""
+    """Generate a test user ID shared by the whole session."""
     return uuid4()
 
 
-@pytest.fixture
-def test_tenant_id():
-    """Set up test tenant context."""
+@pytest.fixture(scope="module", autouse=True)
+def _tenant_context():
+    """Set the test tenant context once per module and restore it afterwards."""
     tenant_id = "test_tenant"
-    set_tenant_context(tenant_id)
+    token = set_tenant_context(tenant_id)
     yield tenant_id
-    clear_tenant_context()
+    reset_tenant_context(token)
+
+
+@pytest.fixture(scope="module")
+def base_storage_prefix(_tenant_context, test_user_id):
+    """Storage path prefix for the test tenant and user."""
+    return f"{_tenant_context}/user_{test_user_id}"
 
 
 def create_mock_file_model(
@@ -76,18 +103,18 @@ def create_mock_file_model(
     path=None,
     file_extension=None,
 ):
-    """Helper to create a mock FileModel instance."""
-    mock_file = create_autospec(FileModel, instance=True)
-    mock_file.id = file_id or uuid4()
-    mock_file.name = name
-    mock_file.storage_provider = storage_provider
-    mock_file.storage_path = storage_path or f"test_tenant/user_{user_id}/{name}"
-    mock_file.user_id = user_id
-    mock_file.size = size
-    mock_file.mime_type = mime_type
-    mock_file.path = path
-    mock_file.file_extension = file_extension
-    return mock_file
+    """Helper to create a lightweight stand-in for a FileModel instance."""
+    return SimpleNamespace(
+        id=file_id or uuid4(),
+        name=name,
+        storage_provider=storage_provider,
+        storage_path=storage_path or f"test_tenant/user_{user_id}/{name}",
+        user_id=user_id,
+        size=size,
+        mime_type=mime_type,
+        path=path,
+        file_extension=file_extension,
+    )
 
 
 # ==================== Unit Tests ====================
@@ -95,9 +122,9 @@ def create_mock_file_model(
 class TestLocalFileManagerService:
     """Test file manager service with real local storage provider."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_create_file_uploads_to_local_storage(
-        self, mock_repository, local_provider, test_user_id, test_tenant_id, temp_storage_dir
+        self, service, mock_repository, local_provider, test_user_id
     ):
         """Test creating a file uploads content to local storage."""
         file_content = b"Hello, World!"
@@ -111,10 +138,6 @@ class TestLocalFileManagerService:
         )
         mock_repository.create_file.return_value = mock_file
 
-        # Create service with real local provider
-        service = FileManagerService(repository=mock_repository)
-        await service.set_storage_provider(local_provider)
-
         # Create mock upload file
         mock_upload_file = create_mock_upload_file(file_name, file_content)
         mock_upload_file.content_type = "text/plain"
@@ -144,19 +167,17 @@ class TestLocalFileManagerService:
         stored_content = await local_provider.download_file(storage_path)
         assert stored_content == file_content
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_get_file_content_reads_from_local_storage(
-        self, mock_repository, temp_storage_dir
+        self, service, local_provider
     ):
         """Test reading file content from local storage."""
         file_content = b"Content to read"
         file_id = uuid4()
         storage_path = "read_test.txt"
 
-        # Pre-upload file to storage using a real local provider
-        preupload_provider = LocalFileSystemProvider(config={"base_path": temp_storage_dir})
-        await preupload_provider.initialize()
-        await preupload_provider.upload_file(file_content, storage_path)
+        # Seed the file directly on disk
+        local_provider._resolve_path(storage_path).write_bytes(file_content)
 
         # Setup mock repository to return file metadata
         mock_file = create_mock_file_model(
@@ -166,28 +187,22 @@ class TestLocalFileManagerService:
             path=storage_path,
         )
 
-        # Create service bound to the same local provider
-        service = FileManagerService(repository=mock_repository)
-        await service.set_storage_provider(preupload_provider)
-
         # Read content
         result = await service.get_file_content(mock_file)
 
         assert result == file_content
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_download_file_fetches_metadata_and_content(
-        self, mock_repository, temp_storage_dir
+        self, service, mock_repository, local_provider
     ):
         """Test download_file returns both metadata and content."""
         file_content = b"Downloaded content"
         file_id = uuid4()
         storage_path = "download_test.txt"
 
-        # Pre-upload file to storage
-        preupload_provider = LocalFileSystemProvider(config={"base_path": temp_storage_dir})
-        await preupload_provider.initialize()
-        await preupload_provider.upload_file(file_content, storage_path)
+        # Seed the file directly on disk
+        local_provider._resolve_path(storage_path).write_bytes(file_content)
 
         # Setup mock repository to return file metadata
         mock_file = create_mock_file_model(
@@ -198,27 +213,25 @@ class TestLocalFileManagerService:
         )
         mock_repository.get_file_by_id.return_value = mock_file
 
-        service = FileManagerService(repository=mock_repository)
-        await service.set_storage_provider(preupload_provider)
-
         db_file, content = await service.download_file(file_id)
 
         assert db_file == mock_file
         assert content == file_content
         mock_repository.get_file_by_id.assert_called_once_with(file_id)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_delete_file_removes_from_local_storage(
-        self, mock_repository, local_provider, test_user_id, test_tenant_id
+        self, service, mock_repository, local_provider, test_user_id, base_storage_prefix
     ):
         """Test deleting a file removes it from local storage."""
         file_content = b"Content to delete"
         file_id = uuid4()
-        storage_path = f"{test_tenant_id}/user_{test_user_id}/delete_test.txt"
+        storage_path = f"{base_storage_prefix}/delete_test.txt"
 
-        # Pre-upload file to storage
-        await local_provider.initialize()
-        await local_provider.upload_file(file_content, storage_path)
+        # Seed the file directly on disk
+        seeded_path = local_provider._resolve_path(storage_path)
+        seeded_path.parent.mkdir(parents=True, exist_ok=True)
+        seeded_path.write_bytes(file_content)
         assert await local_provider.file_exists(storage_path)
 
         # Setup mock repository
@@ -230,10 +243,6 @@ class TestLocalFileManagerService:
         )
         mock_repository.get_file_by_id.return_value = mock_file
 
-        # Create service
-        service = FileManagerService(repository=mock_repository)
-        await service.set_storage_provider(local_provider)
-
         # Delete file
         await service.delete_file(file_id, delete_from_storage=True)
 
@@ -325,14 +334,11 @@ class TestFileManagerServiceBuildFileHeaders:
 class TestFileManagerServiceGetDefaultStorageProvider:
     """Test storage provider initialization helpers."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_initialize_storage_provider_returns_existing_initialized_provider(
-        self, mock_repository, local_provider
+        self, service, local_provider
     ):
         """If a provider is already set and initialized, it should be reused."""
-        service = FileManagerService(repository=mock_repository)
-        await service.set_storage_provider(local_provider)
-
         # Should not attempt to create a new provider; just keep the existing one.
         result = await service._initialize_storage_provider(local_provider.name)
 
@@ -2,109 +2,115 @@
 Unit tests for agent_utils parsing functions
 """
 import pytest
-from app.modules.workflow.agents.agent_utils import parse_json_response, extract_direct_response
+from app.modules.workflow.agents.agent_utils import parse_json_response, parse_json_responses, extract_direct_response
+
+
+GREETING_TEXT = "Hi! I'm here to help you with information about GenAgent, a framework for building AI agents. How can I assist you today?"
+GREETING_REASONING = "Based on my knowledge, providing a friendly greeting and offering assistance is a common and appropriate response to a general greeting."
+
+# Weak models sometimes wrap the whole JSON object in double curly braces
+DOUBLE_CURLY_GREETING = (
+    '{{ "action": "direct_response", "response": "' + GREETING_TEXT
+    + '", "reasoning": "' + GREETING_REASONING + '" }}'
+)
 
 
 class TestParseJsonResponse:
     """Tests for parse_json_response function"""
-    
-    def test_parse_normal_json(self):
-        """Test parsing normal JSON response"""
-        response = '{ "action": "tool_call", "tool_name": "search", "parameters": {"query": "test"} }'
-        result = parse_json_response(response)
-        
-        assert result is not None
-        assert result["action"] == "tool_call"
-        assert result["tool_name"] == "search"
-        assert result["parameters"]["query"] == "test"
-    
-    def test_parse_double_curly_braces(self):
-        """Test parsing JSON wrapped in double curly braces (weak model behavior)"""
-        response = '{{ "action": "direct_response", "response": "Hi! I\'m here to help you with information about GenAgent, a framework for building AI agents. How can I assist you today?", "reasoning": "Based on my knowledge, providing a friendly greeting and offering assistance is a common and appropriate response to a general greeting." }}'
-        result = parse_json_response(response)
-        
-        assert result is not None
-        assert result["action"] == "direct_response"
-        assert "Hi! I'm here to help you" in result["response"]
-        assert result["reasoning"] is not None
-    
-    def test_parse_json_with_extra_text(self):
-        """Test parsing JSON with surrounding text"""
-        response = 'Some text before { "action": "tool_call", "tool_name": "search" } some text after'
-        result = parse_json_response(response)
-        
-        assert result is not None
-        assert result["action"] == "tool_call"
-        assert result["tool_name"] == "search"
-    
-    def test_parse_invalid_json(self):
-        """Test parsing invalid JSON returns None"""
-        response = 'This is not JSON at all'
-        result = parse_json_response(response)
-        
-        assert result is None
-    
-    def test_parse_empty_string(self):
-        """Test parsing empty string"""
-        response = ''
-        result = parse_json_response(response)
-        
-        assert result is None
+
+    @pytest.mark.parametrize("response,expected", [
+        pytest.param(
+            '{ "action": "tool_call", "tool_name": "search", "parameters": {"query": "test"} }',
+            {"action": "tool_call", "tool_name": "search", "parameters": {"query": "test"}},
+            id="normal_json",
+        ),
+        pytest.param(
+            DOUBLE_CURLY_GREETING,
+            {"action": "direct_response", "response": GREETING_TEXT, "reasoning": GREETING_REASONING},
+            id="double_curly_braces",
+        ),
+        pytest.param(
+            '{{ "action": "tool_call", "tool_name": "search", "parameters": {{ "query": "test" }} }}',
+            {"action": "tool_call", "tool_name": "search", "parameters": {"query": "test"}},
+            id="nested_double_curly_braces",
+        ),
+        pytest.param(
+            'Some text before { "action": "tool_call", "tool_name": "search" } some text after',
+            {"action": "tool_call", "tool_name": "search"},
+            id="json_with_extra_text",
+        ),
+        pytest.param(
+            'Result: { "action": "direct_response", "response": "use {name} or \\"}\\"" } done.',
+            {"action": "direct_response", "response": 'use {name} or "}"'},
+            id="braces_in_strings",
+        ),
+        pytest.param(
+            '{ "action": "tool_call", "tool_name": "search" } and later { "action": "other" }',
+            {"action": "tool_call", "tool_name": "search"},
+            id="first_of_multiple_json_objects",
+        ),
+        pytest.param(
+            '{ "action": "tool_call", "parameters": {"id": 123456789012345678901234567890} }',
+            {"action": "tool_call", "parameters": {"id": 123456789012345678901234567890}},
+            id="big_integer_kept_exact",
+        ),
+        pytest.param(
+            '{{ "action": "tool_call", "parameters": {{ "id": 123456789012345678901234567890 }} }}',
+            {"action": "tool_call", "parameters": {"id": 123456789012345678901234567890}},
+            id="big_integer_kept_exact_double_curly_braces",
+        ),
+        pytest.param('{ "score": 1e999 }', {"score": float("inf")}, id="out_of_range_float"),
+        pytest.param('This is not JSON at all', None, id="invalid_json"),
+        pytest.param('', None, id="empty_string"),
+    ])
+    def test_parse_json_response(self, response, expected):
+        """Test parsing JSON responses in the shapes models produce"""
+        assert parse_json_response(response) == expected
+
+    def test_parse_repeated_response_returns_independent_dicts(self):
+        """Test repeated (cached) parses don't share mutable results"""
+        response = '{ "action": "tool_call", "parameters": {"query": "test"} }'
+        first = parse_json_response(response)
+        first["parameters"]["query"] = "changed"
+        second = parse_json_response(response)
+
+        assert second["parameters"]["query"] == "test"
+
+    def test_parse_json_responses_batch(self):
+        """Test batch parsing keeps order and per-item results"""
+        responses = ['{ "action": "tool_call" }', 'plain text', '{{ "action": "direct_response" }}']
+        results = parse_json_responses(responses)
+
+        assert results == [{"action": "tool_call"}, None, {"action": "direct_response"}]
 
 
 class TestExtractDirectResponse:
     """Tests for extract_direct_response function"""
-    
-    def test_extract_normal_direct_response(self):
-        """Test extracting direct response from normal JSON"""
-        response = '{ "action": "direct_response", "response": "Hello, how can I help you?" }'
-        result = extract_direct_response(response)
-        
-        assert result == "Hello, how can I help you?"
-    
-    def test_extract_direct_response_with_double_curly_braces(self):
-        """Test extracting direct response from JSON with double curly braces"""
-        response = '{{ "action": "direct_response", "response": "Hi! I\'m here to help you with information about GenAgent, a framework for building AI agents. How can I assist you today?", "reasoning": "Based on my knowledge, providing a friendly greeting and offering assistance is a common and appropriate response to a general greeting." }}'
-        result = extract_direct_response(response)
-        
-        assert result is not None
-        assert "Hi! I'm here to help you" in result
-        assert "GenAgent" in result
-    
-    def test_extract_direct_response_empty_response_field(self):
-        """Test extracting direct response with empty response field"""
-        response = '{ "action": "direct_response", "response": "" }'
-        result = extract_direct_response(response)
-        
-        assert result == ""
-    
-    def test_extract_direct_response_missing_response_field(self):
-        """Test extracting direct response with missing response field"""
-        response = '{ "action": "direct_response" }'
-        result = extract_direct_response(response)
-        
-        assert result == ""
-    
-    def test_extract_non_direct_response_json(self):
-        """Test extracting from non-direct-response JSON returns None"""
-        response = '{ "action": "tool_call", "tool_name": "search" }'
-        result = extract_direct_response(response)
-        
-        assert result is None
-    
-    def test_extract_plain_text(self):
-        """Test extracting from plain text returns the text"""
-        response = 'This is just plain text without JSON'
-        result = extract_direct_response(response)
-        
-        assert result == response
-    
-    def test_extract_direct_response_fallback_parsing(self):
-        """Test fallback parsing with double curly braces"""
-        response = '{{ "action": "direct_response", "response": "Test response" }}'
-        result = extract_direct_response(response)
-        
-        assert result == "Test response"
+
+    @pytest.mark.parametrize("response,expected", [
+        pytest.param(
+            '{ "action": "direct_response", "response": "Hello, how can I help you?" }',
+            "Hello, how can I help you?",
+            id="normal_direct_response",
+        ),
+        pytest.param(DOUBLE_CURLY_GREETING, GREETING_TEXT, id="double_curly_braces"),
+        pytest.param('{ "action": "direct_response", "response": "" }', "", id="empty_response_field"),
+        pytest.param('{ "action": "direct_response" }', "", id="missing_response_field"),
+        pytest.param('{ "action": "tool_call", "tool_name": "search" }', None, id="non_direct_response_json"),
+        pytest.param(
+            'This is just plain text without JSON',
+            'This is just plain text without JSON',
+            id="plain_text",
+        ),
+        pytest.param(
+            '{{ "action": "direct_response", "response": "Test response" }}',
+            "Test response",
+            id="fallback_double_curly_braces",
+        ),
+    ])
+    def test_extract_direct_response(self, response, expected):
+        """Test extracting the direct response text from model output"""
+        assert extract_direct_response(response) == expected
 
 
 if __name__ == "__main__":
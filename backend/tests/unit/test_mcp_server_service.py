@@ -0,0 +1,91 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+
+from app.auth.utils import hash_api_key
+from app.services.mcp_server import MCPServerService
+from app.repositories.mcp_server import MCPServerRepository
+from app.repositories.workflow import WorkflowRepository
+from app.schemas.mcp_server import MCPServerUpdate
+
+
+@pytest.fixture(autouse=True)
+def init_cache():
+    """Initialize FastAPICache with in-memory backend for unit tests."""
+    # Same prefix as production so invalidate_cache targets the cached keys
+    FastAPICache.init(InMemoryBackend(), prefix="auth")
+    yield
+    FastAPICache.reset()
+
+
+@pytest.fixture
+def mock_repository():
+    return AsyncMock(spec=MCPServerRepository)
+
+
+@pytest.fixture
+def mcp_server_service(mock_repository):
+    service = MCPServerService(repo=mock_repository, workflow_repo=AsyncMock(spec=WorkflowRepository))
+    # Keep responses picklable for the cache coder
+    service._to_response = AsyncMock(side_effect=lambda server, base_url=None: {"id": server.id})
+    return service
+
+
+@pytest.fixture
+def user_id():
+    with patch("app.services.mcp_server.get_current_user_id", return_value=uuid4()) as mock_user_id:
+        yield mock_user_id.return_value
+
+
+def make_mcp_server(api_key: str, is_active: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(id=uuid4(), name="mcp", api_key_hash=hash_api_key(api_key), is_active=is_active)
+
+
+@pytest.mark.asyncio
+async def test_validate_api_key_caches_miss(mcp_server_service, mock_repository):
+    api_key = f"missing-{uuid4().hex}"
+    mock_repository.get_by_api_key_hash.return_value = None
+
+    assert await mcp_server_service.validate_api_key(api_key) is None
+    assert await mcp_server_service.validate_api_key(api_key) is None
+
+    mock_repository.get_by_api_key_hash.assert_called_once_with(hash_api_key(api_key))
+
+
+@pytest.mark.asyncio
+async def test_deactivating_server_revokes_cached_api_key(mcp_server_service, mock_repository, user_id):
+    api_key = f"active-{uuid4().hex}"
+    server = make_mcp_server(api_key)
+    mock_repository.get_by_api_key_hash.return_value = server
+    mock_repository.get_by_id.return_value = server
+
+    assert await mcp_server_service.validate_api_key(api_key) == {"id": server.id}
+
+    inactive = make_mcp_server(api_key, is_active=0)
+    mock_repository.update.return_value = inactive
+    mock_repository.get_by_api_key_hash.return_value = inactive
+    await mcp_server_service.update(server.id, MCPServerUpdate(is_active=0))
+
+    assert await mcp_server_service.validate_api_key(api_key) is None
+    assert mock_repository.get_by_api_key_hash.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_deleting_server_revokes_cached_api_key(mcp_server_service, mock_repository, user_id):
+    api_key = f"deleted-{uuid4().hex}"
+    server = make_mcp_server(api_key)
+    mock_repository.get_by_api_key_hash.return_value = server
+    mock_repository.get_by_id.return_value = server
+
+    assert await mcp_server_service.validate_api_key(api_key) == {"id": server.id}
+
+    mock_repository.delete.return_value = True
+    mock_repository.get_by_api_key_hash.return_value = None
+    assert await mcp_server_service.delete(server.id) is True
+
+    assert await mcp_server_service.validate_api_key(api_key) is None
+    assert mock_repository.get_by_api_key_hash.call_count == 2
@@ -0,0 +1,61 @@
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.core.config.settings import settings
+from app.modules.websockets.socket_connection_manager import Connection, SocketConnectionManager
+
+
+ROOM_ID = "conversation-1"
+TENANT_ID = "test_tenant"
+PAYLOAD = {"id": "abc", "messages": [{"text": "hi {there}", "score": 1.5}], "closed": None}
+
+
+@pytest.fixture(autouse=True)
+def enable_websockets(monkeypatch):
+    monkeypatch.setattr(settings, "USE_WS", True)
+
+
+def connect(manager: SocketConnectionManager) -> AsyncMock:
+    """Register a connection in the tenant-aware room and return its websocket."""
+    websocket = MagicMock()
+    websocket.send_text = AsyncMock()
+    room = manager._get_tenant_aware_room_id(ROOM_ID, TENANT_ID)
+    manager._rooms[room] = [Connection(websocket=websocket, user_id=uuid4(), permissions=[], tenant_id=TENANT_ID)]
+    return websocket
+
+
+class TestBroadcastRaw:
+    """Test broadcasting payloads that are already serialized to JSON."""
+
+    @pytest.mark.asyncio
+    async def test_local_frame_matches_broadcast(self):
+        manager = SocketConnectionManager()
+        websocket = connect(manager)
+
+        await manager.broadcast(ROOM_ID, "statistics", uuid4(), payload=dict(PAYLOAD), tenant_id=TENANT_ID)
+        await manager.broadcast_raw(ROOM_ID, "statistics", payload_json=json.dumps(PAYLOAD), tenant_id=TENANT_ID)
+
+        encoded_frame, raw_frame = [call.args[0] for call in websocket.send_text.await_args_list]
+        assert json.loads(raw_frame) == json.loads(encoded_frame) == {"type": "statistics", "payload": PAYLOAD}
+
+    @pytest.mark.asyncio
+    async def test_redis_round_trip_delivers_payload_raw(self):
+        redis_client = MagicMock()
+        redis_client.publish = AsyncMock()
+        manager = SocketConnectionManager(redis_client=redis_client)
+        websocket = connect(manager)
+
+        await manager.broadcast_raw(ROOM_ID, "statistics", payload_json=json.dumps(PAYLOAD), tenant_id=TENANT_ID)
+
+        channel, data = redis_client.publish.await_args.args
+        assert json.loads(data)["payload_raw"] == json.dumps(PAYLOAD)
+        # Instances on the previous release only read "payload"
+        assert json.loads(data)["payload"] == PAYLOAD
+        websocket.send_text.assert_not_awaited()
+
+        await manager._handle_redis_message({"channel": channel, "data": data})
+
+        frame = websocket.send_text.await_args.args[0]
+        assert json.loads(frame) == {"type": "statistics", "payload": PAYLOAD}